@@ -1,76 +1,190 @@
-from flask import Flask, render_template, request
-from chatterbot import ChatBot
-from chatterbot.trainers import ListTrainer
-from chatterbot.trainers import ChatterBotCorpusTrainer
+from flask import Flask, render_template, request, make_response
+from flask_compress import Compress
 import trainingData
-import random
+import os
+import re
+import functools
+import hashlib
+import threading
+import numpy as np
+from sentence_transformers import SentenceTransformer
 from spellchecker import SpellChecker
 
 app = Flask(__name__)
+Compress(app)
 
-hal = ChatBot("HAL")
+#the heavyweight pieces - the ~50k word spell checker dictionary and the
+#embedding model plus corpus matrix - are created lazily behind an unbounded
+#lru_cache so importing the module stays cheap and workers that never hit /get pay
+#nothing. a background thread warms them at startup so the first chat request
+#doesn't eat the load either
+@functools.lru_cache(maxsize=None)
+def getSpellChecker():
+    return SpellChecker()
 
-#trains the AI chatbot in english using the corpus_trainer
-corpus_trainer = ChatterBotCorpusTrainer(hal);
-corpus_trainer.train("chatterbot.corpus.english.ai")
-corpus_trainer.train("chatterbot.corpus.english.conversations")
-corpus_trainer.train("chatterbot.corpus.english.computers")
-corpus_trainer.train("chatterbot.corpus.english.emotion")
-corpus_trainer.train("chatterbot.corpus.english.greetings")
-corpus_trainer.train("chatterbot.corpus.english.movies")
+@functools.lru_cache(maxsize=None)
+def getEmbedder():
+    return SentenceTransformer('all-MiniLM-L6-v2')
 
-#trains HAL using the training data defined in trainingData.py
-conversationTrainer = ListTrainer(hal)
-conversationTrainer.train(trainingData.casualConversation)
-conversationTrainer.train(trainingData.basicAdvice)
-conversationTrainer.train(trainingData.advisor)
-conversationTrainer.train(trainingData.gpaToTransfer)
+#the free-form fallback used to go through ChatterBot, which ran a python
+#level string similarity against every trained statement on each request. the
+#training questions are embedded once instead, and a request is answered by
+#the closest question under cosine similarity, computed as one matrix-vector
+#product
+#encoding the corpus only changes when the training data does, so the matrix
+#is cached on disk keyed by a digest of the questions. a warm start loads the
+#matrix instead of re-encoding ~300 sentences, and the Dockerfile pre-computes
+#the file at build time so containers never encode at all
+embeddingCacheFile = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpusEmbeddings.npz')
 
-correctTypos = SpellChecker()
+@functools.lru_cache(maxsize=None)
+def getCorpusIndex():
+    #question/answer pairs pulled from the flat training lists
+    corpusQuestions = []
+    corpusAnswers = []
+    for trainingList in (trainingData.casualConversation, trainingData.basicAdvice,
+            trainingData.advisor, trainingData.gpaToTransfer):
+        corpusQuestions.extend(trainingList[0::2])
+        corpusAnswers.extend(trainingList[1::2])
+
+    corpusDigest = hashlib.sha1('\n'.join(corpusQuestions).encode('utf-8')).hexdigest()
+    try:
+        cached = np.load(embeddingCacheFile, allow_pickle=False)
+        if(str(cached['digest']) == corpusDigest):
+            return corpusAnswers, cached['matrix']
+    except Exception:
+        #a missing, stale or corrupt cache file just means encoding again
+        pass
+
+    corpusMatrix = np.asarray(
+        getEmbedder().encode(corpusQuestions, normalize_embeddings=True), dtype=np.float32)
+    try:
+        #write to a temp file and rename so a crash mid-write can't leave a
+        #truncated archive behind for the next start to choke on
+        tempFile = embeddingCacheFile + '.tmp'
+        with open(tempFile, 'wb') as cacheHandle:
+            np.savez(cacheHandle, digest=corpusDigest, matrix=corpusMatrix)
+        os.replace(tempFile, embeddingCacheFile)
+    except OSError:
+        #a read-only filesystem just means the next start encodes again
+        pass
+    return corpusAnswers, corpusMatrix
+
+def warmCaches():
+    getSpellChecker()
+    getCorpusIndex()
+
+threading.Thread(target=warmCaches, daemon=True).start()
+
+#anything below this similarity is too far from the training data to answer
+similarityFloor = 0.35
+unknownResponse = ("sorry, i'm not sure about that one. you can book an appointment with an advisor here: "
+    "https://sjsu.campus.eab.com/student/appointments/new")
+
+#chat traffic repeats the same questions a lot, so memoize the spell checker's
+#edit-distance candidate search instead of re-running it on every request.
+#correction() returns None when it has no candidate - which is most multi-word
+#messages on pyspellchecker >= 0.6.3 - so fall back to the original text
+#rather than caching and propagating the None
+@functools.lru_cache(maxsize=4096)
+def correctMessage(message):
+    corrected = getSpellChecker().correction(message)
+    return corrected if corrected is not None else message
+
+#prereq answers are fixed for a given tag, so mark them cacheable and let a
+#reverse proxy or the browser short-circuit repeat lookups
+def cacheableResponse(responseText):
+    response = make_response(responseText)
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
+#every lookup table below is lowercase, so the message is lowercased, stripped
+#and spell-corrected exactly once per request through this helper
+def normalizeMessage(message):
+    return correctMessage(message.lower().strip())
+
+#answers for the free-form path are still cached per message, so repeats skip
+#the embedding call entirely. one answer per question is fine for an FAQ bot
+@functools.lru_cache(maxsize=2048)
+def fallbackResponse(message):
+    #canned questions are answered straight from the exact-match indexes
+    #without touching the embedding model
+    exactAnswer = trainingData.cannedResponse(message)
+    if(exactAnswer is not None):
+        return exactAnswer
+    corpusAnswers, corpusMatrix = getCorpusIndex()
+    queryVector = np.asarray(
+        getEmbedder().encode([message], normalize_embeddings=True)[0], dtype=np.float32)
+    scores = corpusMatrix @ queryVector
+    best = int(scores.argmax())
+    if(scores[best] < similarityFloor):
+        return unknownResponse
+    return corpusAnswers[best]
 
-tag_list = ['cs 149', 'ise 164', 'cs 146', 'cmpe 131', 'cmpe 120', 'cmpe 102', 'cmpe 133', 'cmpe 148', 'cmpe 165', 'cmpe 172', 'cmpe 187', 'cmpe 195a', 'cmpe 195b', 'engr 195a', 'engr 195b', 'engr 195', 'cmpe 195', 'cmpe195', 'engr195', 'cs 151', 'cs 157a', 'cs 166', 'cs149', 'ise164', 'cs146', 'cmpe131', 'cmpe120', 'cmpe102', 'cmpe133', 'cmpe148', 'cmpe165', 'cmpe172', 'cmpe187', 'cmpe195a', 'cmpe195b', 'engr195a', 'engr195b', 'engr195', 'cmpe195', 'cs151', 'cs157a', 'cs166', 'how many units should i take', 'cmpe 137', 'cmpe137', 'cmpe 139', 'cmpe139', 'cmpe 152', 'cmpe152', 'cmpe 185', 'cmpe185', 'cmpe 181', 'cmpe181', 'cmpe 182', 'cmpe182', 'cmpe 183', 'cmpe183', 'cmpe 185', 'cmpe185', 'cmpe 188', 'cmpe188', 'cmpe 189', 'cmpe189', 'cs 116a', 'cs116a', 'cs 134', 'cs134', 'cs 152', 'cs152']
-prereq = ['prerequisite', 'prereq', 'prerequisites', 'prereqs', 'take before', 'what class do i need to']
 addOrDrop = ['add', 'enroll', 'drop']
 classTag = ['class', 'classes']
 altClassTags = ['refund', 'late', 'deadline', 'latest', 'last']
 
+#one compiled pattern replaces the old 60+ entry tag list. the optional space
+#normalizes 'cs149' and 'cs 149' to the same tag, so the spaced/unspaced
+#duplicate entries aren't needed anymore
+courseTagRe = re.compile(r'\b(cs|cmpe|engr|ise)\s?(\d{2,3}[ab]?)\b')
+prereqRe = re.compile(r'\b(?:prerequisites?|prereqs?|take before|what class do i need to)\b')
+
+#the one tag that isn't a course code
+unitsTag = 'how many units should i take'
+
+#index the intents by tag once at import so each request is a dict lookup
+#instead of a linear scan over the intent lists. only the responses are kept,
+#already immutable tuples on the PrereqIntent records
+prereqByTag = {}
+for intent in trainingData.overallPrereq:
+    prereqByTag.setdefault(intent.tag, intent.responses)
+
+addAndDropByTag = {intent['tag']: intent for intent in trainingData.addAndDrop}
+
 @app.route('/')
 def index():
     return render_template('base.html')
 
 @app.route("/get")
 def getResponse():
-    userMessage = request.args.get('msg')
-    userMessage = userMessage.lower()
-    userMessage = correctTypos.correction(userMessage)
-    tag = [s for s in tag_list if(s in userMessage)]
-    hasPrereq = [s for s in prereq if(s in userMessage)]
+    userMessage = normalizeMessage(request.args.get('msg'))
+    tag = None
+    tagMatch = courseTagRe.search(userMessage)
+    if(tagMatch):
+        course = tagMatch.group(1) + ' ' + tagMatch.group(2)
+        if(course in prereqByTag):
+            tag = course
+    if(tag is None and unitsTag in userMessage):
+        tag = unitsTag
+    hasPrereq = prereqRe.search(userMessage)
 
     hasAddorDrop = [s for s in addOrDrop if(s in userMessage)]
     hasClass = [s for s in classTag if(s in userMessage)]
     hasAltClassTags = [s for s in altClassTags if(s in userMessage)]
 
     if(bool(tag) and bool(hasPrereq)):
-        selected_intent = next((i for i in trainingData.overallPrereq if i['tag'] == tag[0]), None)
-        possibleResponses = selected_intent['responses']
+        possibleResponses = prereqByTag[tag]
         response = possibleResponses[0]
-        return str(response)
+        return cacheableResponse(str(response))
     elif(bool(hasPrereq) and not(bool(tag))):
-        return "sorry i don't know the prerequiste for that. you can check using the course catalog here: https://catalog.sjsu.edu/content.php?catoid=12&navoid=4145"
+        return cacheableResponse("sorry i don't know the prerequiste for that. you can check using the course catalog here: https://catalog.sjsu.edu/content.php?catoid=12&navoid=4145")
     elif(not(bool(hasPrereq)) and bool(tag)):
-        selected_intent = next((i for i in trainingData.overallPrereq if i['tag'] == tag[0]), None)
-        possibleResponses = selected_intent['responses']
+        possibleResponses = prereqByTag[tag]
         response = possibleResponses[1]
-        return str(response)
+        return cacheableResponse(str(response))
     elif((bool(hasAltClassTags))):
-        return str(hal.get_response(userMessage))
+        return fallbackResponse(userMessage)
     elif((bool(hasAddorDrop) and bool(hasClass))):
-        selected_intent = next((i for i in trainingData.addAndDrop if i['tag'] == hasAddorDrop[0]), None)
+        selected_intent = addAndDropByTag.get(hasAddorDrop[0])
         possibleResponses = selected_intent['responses']
         response = possibleResponses[0]
         return str(response)
     else:
-        return str(hal.get_response(userMessage))
+        return fallbackResponse(userMessage)
 
+#local development entry point. in production run the app under a real WSGI
+#server instead: gunicorn --preload -w 4 -b 0.0.0.0:5000 runChatbot:app
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(debug=(os.environ.get('FLASK_DEBUG') == '1'))